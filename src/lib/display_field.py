@@ -44,6 +44,8 @@ class DisplayField:
     decimals: int = 2
     is_int: bool = False
     _value: float | int | str | None = field(default=None, init=False, repr=False)
+    # The text last written to var, so setting the same value again skips the Tcl write.
+    _rendered: str | None = field(default=None, init=False, repr=False)
 
     def set(self, value: float | int | str | None) -> None:
         """ Set the underlying value of the field and update the StringVar if it exists. 
@@ -52,7 +54,10 @@ class DisplayField:
         """
         self._value = value
         if self.var is not None:
-            self.var.set(self.render())
+            text = self.render()
+            if text != self._rendered:
+                self.var.set(text)
+                self._rendered = text
 
     def get(self) -> float | int | str | None:
         """ Get the underlying value of the field. 
@@ -103,9 +103,7 @@ def convert_json(transcript_list: Sequence["TranscriptSnippet"])->str:
             A formatted string representation of the transcript snippets, preserving
             the original JSON structure with text, start time, and duration.
     """
-    snippets: list[str] = []
-
-    for entry in transcript_list:
-        snippets.append(f"{{text: {entry['text']}, start={entry['start']}"
-                        f", duration={entry['duration']}}},")
-    return "\n".join(snippets)
+    return "\n".join(
+        f"{{text: {entry['text']}, start={entry['start']}, duration={entry['duration']}}},"
+        for entry in transcript_list
+    )
@@ -3,10 +3,18 @@
     with a simple file-based cache.
 """
 from __future__ import annotations
-from dataclasses import asdict, dataclass
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass, fields, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from typing import Any
 from yt_lib.yt_ids import YoutubeIdKind, extract_video_id
 from yt_lib.ytdlp_info import (
                                 YtdlpInfo,
@@ -20,6 +28,66 @@ from yt_lib.utils.app_context import RuntimeContext
 
 logger = get_logger(__name__)
 
+# Suffix of the cached yt-dlp info files: <cache_dir>/<video_id>.json
+INFO_SUFFIX = ".json"
+# Sidecar file holding the index entries, one JSON object per line, so a startup scan
+# doesn't have to open and parse every cached info file: <cache_dir>/_index.jsonl
+INDEX_FILE_NAME = "_index.jsonl"
+# A canonical 11 character YouTube video ID.
+_VIDEO_ID_RE: re.Pattern[str] = re.compile(r"[A-Za-z0-9_-]{11}")
+# Number of parsed YtdlpInfo objects InfoManager keeps in memory for repeat lookups.
+INFO_LRU_SIZE = 64
+
+
+def _load_json(path: Path) -> Any:
+    """ Read and parse a JSON file.
+        Args:
+            path: The JSON file to read.
+        Returns:
+            The parsed JSON data.
+    """
+    return json.loads(path.read_bytes())
+
+
+def _matches_file(path: Path, data: Any) -> bool:
+    """ Check whether a JSON file already holds the given data.
+        Args:
+            path: The JSON file to compare against.
+            data: The data about to be written to the file.
+        Returns:
+            True if the file exists and parses to data, False otherwise.
+    """
+    try:
+        return _load_json(path) == data
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError) as e:
+        logger.debug("Could not compare with %s: %s", path, e)
+        return False
+
+
+def _dumps(obj: Any) -> bytes:
+    """ Serialize an object to compact UTF-8 JSON.
+        Args:
+            obj: The object to serialize.
+        Returns:
+            The JSON as UTF-8 bytes, ready to be written to a file.
+    """
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _unlink_cache_file(de: os.DirEntry[str]) -> None:
+    """ Delete a cache artifact found by scandir, logging rather than raising on failure.
+        Args:
+            de: The directory entry of the file to delete.
+    """
+    try:
+        os.unlink(de.path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning("Failed to delete stale cache file %s: %s", de.path, e)
+
 
 def filetime_to_datetime(file: Path) -> datetime:
     """ Convert a file's modification time to a timezone-aware datetime (UTC).
@@ -55,29 +123,147 @@ class YouTubeSource:
             title=info.get("title"),
         )
 
-def _atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
-    """ Write text atomically by replacing a temp file in the same directory.
+    @classmethod
+    def from_info(cls, *, info: YtdlpInfo) -> YouTubeSource:
+        """ Build a YouTubeSource straight from a YtdlpInfo's attributes.
+            Args:
+                info: A YtdlpInfo object containing the metadata for a YouTube source.
+            Returns:
+                A YouTubeSource object populated with the data from the YtdlpInfo object.
+            Note:
+                Unlike passing asdict(info) to from_ytdlpinfo, this doesn't deep copy every
+                field of the info (formats, thumbnails, the raw yt-dlp dict, ...) just to
+                read four of them.
+        """
+        return cls(
+            kind=YoutubeIdKind.VIDEO,
+            url=info.webpage_url if info.webpage_url else getattr(info, "original_url", None),
+            id=info.id,
+            title=info.title,
+        )
+
+# YouTubeSource fields saved per entry in the index sidecar, besides the mtime. Worked out
+# once at import rather than calling dataclasses.fields() for every entry.
+_INDEX_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(YouTubeSource) if f.name != "kind")
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """ Write bytes atomically by replacing a temp file in the same directory, which must
+        already exist.
         Args:
-            path: The path to write the text to.
-            text: The text to write.
-            encoding: The encoding to use when writing the text.
+            path: The path to write the bytes to.
+            data: The bytes to write.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
     with NamedTemporaryFile(
-        mode="w",
+        mode="wb",
         delete=False,
         dir=path.parent,
-        encoding=encoding,
-        newline="\n",
     ) as tf:
         tmp = Path(tf.name)
-        tf.write(text)
+        tf.write(data)
         tf.flush()
     tmp.replace(path)
 
 
 
 
+# An index entry: the info file's mtime and the video's id, URL and title.
+type IndexEntry = tuple[float, YouTubeSource]
+
+
+class CacheIndex:
+    """ The in-memory index of cached videos, keyed by video ID.
+        The newest -> oldest view of the entries, and any lists built from it with
+        derived(), are only rebuilt when they are read after the entries have changed.
+    """
+
+    def __init__(self) -> None:
+        """ Start with an empty index."""
+        self._entries: dict[str, IndexEntry] = {}
+        self._sorted: list[IndexEntry] | None = []
+        self._derived: dict[str, list[Any]] = {}
+        # Bumped whenever the entries change, so callers can tell when to read them again.
+        self.version: int = 0
+
+    def changed(self) -> None:
+        """ Note that the entries changed, so the sorted view and derived lists are rebuilt."""
+        self._sorted = None
+        self._derived.clear()
+        self.version += 1
+
+    def get(self, video_id: str) -> IndexEntry | None:
+        """ Get the entry for a video ID, or None if it isn't in the index."""
+        return self._entries.get(video_id)
+
+    def put(self, video_id: str, entry: IndexEntry) -> None:
+        """ Add or replace the entry for a video ID."""
+        self._entries[video_id] = entry
+        self.changed()
+
+    def pop(self, video_id: str) -> IndexEntry | None:
+        """ Remove and return the entry for a video ID, or None if it isn't in the index."""
+        entry = self._entries.pop(video_id, None)
+        if entry is not None:
+            self.changed()
+        return entry
+
+    def replace_all(self, entries: Iterable[IndexEntry]) -> None:
+        """ Replace every entry, e.g. after rescanning the cache directory."""
+        self._entries = {yt_src.id: (mt, yt_src) for mt, yt_src in entries}
+        self.changed()
+
+    def sorted(self) -> list[IndexEntry]:
+        """ The entries sorted newest -> oldest.
+            Returns:
+                A list of (mtime, YouTubeSource) tuples. It is shared until the entries
+                change, so callers must not modify it.
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self._entries.values(), key=lambda t: t[0], reverse=True)
+        return self._sorted
+
+    def derived(self, name: str, build: Callable[[list[IndexEntry]], list[Any]]) -> list[Any]:
+        """ Get a list built from the sorted entries, building it only if the entries have
+            changed since it was last built.
+            Args:
+                name: Identifies the list among those built from this index.
+                build: Builds the list from the sorted entries.
+            Returns:
+                The list. It is shared until the entries change, so callers must not
+                modify it.
+        """
+        built = self._derived.get(name)
+        if built is None:
+            built = self._derived[name] = build(self.sorted())
+        return built
+
+
+def _urls_of(entries: list[IndexEntry]) -> list[str]:
+    """ List the URLs of the given index entries, in order."""
+    urls: list[str] = []
+    for _, yt_source in entries:
+        try:
+            urls.append(yt_source.url)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Error reading URL from %s: %s", yt_source, e)
+            continue
+    return urls
+
+
+def _prompts_of(entries: list[IndexEntry]) -> list[dict[str,str]]:
+    """ List the history dialog's title and URL for each of the given index entries."""
+    choices: list[dict[str,str]] = []
+    for _, yt_source in entries:
+        try:
+            # List entries as Video ID: Title
+            key = yt_source.id + ": " + yt_source.title
+            choices.append({'title':key, 'url':yt_source.url})
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Error reading URL or Title from %s: %s", yt_source, e)
+            continue
+    return choices
+
+
 class InfoManager:
     """
         Controls the caching and retrieval of YouTube video metadata (YtdlpInfo) Manages:
@@ -88,10 +274,13 @@ class InfoManager:
             - Providing a list of cached URLs and titles for UI prompts.
         Cache layout:
           <cache_dir>/<video_id>.info   (JSON serialized VideoMetadata)
+          <cache_dir>/_index.jsonl      (mtime, id, url and title of each entry)
 
         In-memory index:
+          self._index: a CacheIndex of (mtime, YouTubeSource) by video ID, and
           self.yt_source_list: list[tuple[mtime, YouTubeSource]] sorted newest->oldest,
-          with Paths pointing to .info files.
+          with Paths pointing to .info files. The sorted list is only rebuilt when it is
+          read after the index has changed.
     """
 
     # def __init__(self, *, app_name: str = "transcripts", start: Path | None = None) -> None:
@@ -102,28 +291,149 @@ class InfoManager:
         """
         self.ctx_store = rt_ctx_store
         self.cache_dir: Path = self.ctx_store.cache_dir
-        self.yt_source_list: list[tuple[float, YouTubeSource]] = []
+        # Created once here, so writes into the cache don't each have to check for it.
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index = CacheIndex()
+        # Recently used YtdlpInfo by video ID, least recently used first, so switching back
+        # to a video doesn't re-read and re-parse its info file.
+        self._info_lru: OrderedDict[str, YtdlpInfo] = OrderedDict()
+        # Set when an index update failed, so the index is rebuilt from disk the next time
+        # it is read (see _reindex_if_needed) rather than right away.
+        self._needs_reindex: bool = False
+        # Set when the in-memory index has mtimes the sidecar doesn't, so it is rewritten
+        # with the next cache write or by save_index() rather than on every cache hit.
+        self._index_file_dirty: bool = False
         self.refresh_index()
 
+    @property
+    def yt_source_list(self) -> list[IndexEntry]:
+        """ The index entries sorted newest -> oldest, re-sorted only if the index changed.
+            Returns:
+                A list of (mtime, YouTubeSource) tuples. It is shared until the index
+                changes, so callers must not modify it.
+        """
+        return self._index.sorted()
+
+    @property
+    def index_version(self) -> int:
+        """ A number that changes whenever the index does, so callers can skip work while
+            it stays the same.
+        """
+        return self._index.version
+
+    def _remember_info(self, video_id: str, info: YtdlpInfo) -> None:
+        """ Add a YtdlpInfo to the in-memory LRU, evicting the least recently used if full.
+            Args:
+                video_id: The YouTube video ID the info is for.
+                info: The parsed YtdlpInfo to keep.
+        """
+        self._info_lru[video_id] = info
+        self._info_lru.move_to_end(video_id)
+        if len(self._info_lru) > INFO_LRU_SIZE:
+            self._info_lru.popitem(last=False)
+
+    def _reindex_if_needed(self) -> None:
+        """ Run the rescan deferred by a failed index update, if there is one."""
+        if self._needs_reindex:
+            self.refresh_index()
+
     # ----------------------------
     # Indexing / sorting
     # ----------------------------
 
     def refresh_index(self) -> None:
-        """ Rebuild the in-memory file index from disk (newest -> oldest)."""
+        """ Rebuild the in-memory file index from disk (newest -> oldest).
+            Entries in the index sidecar whose info file still has the same mtime are reused
+            as is; only new or changed info files are opened and parsed. The sidecar is
+            rewritten if anything differed from it.
+        """
+        self._needs_reindex = False
         entries: list[tuple[float, YouTubeSource]] = []
-        for p in self.cache_dir.glob("*.json"):
-            if not p.is_file():
-                continue
-            try:
-                info = read_ytdlp_info(p)
-                yt_source: YouTubeSource = YouTubeSource.from_ytdlpinfo(info=asdict(info))
-                entries.append((p.stat().st_mtime, yt_source))
-            except OSError:
-                continue
+        try:
+            dir_iter = os.scandir(self.cache_dir)
+        except FileNotFoundError:
+            self._index.replace_all(())
+            return
 
-        entries.sort(key=lambda t: t[0], reverse=True)
-        self.yt_source_list = entries
+        saved = self._load_index_file()
+        changed = False
+        # scandir's entries carry the file type from the directory read, so only files
+        # that pass the name check cost a stat().
+        with dir_iter:
+            for de in dir_iter:
+                if not de.name.endswith(INFO_SUFFIX) or not de.is_file():
+                    continue
+                # Files are named by the ID cache_ytdlpinfo settled on, which isn't always
+                # the id inside the file, so the name is what the index is keyed by.
+                video_id = de.name[:-len(INFO_SUFFIX)]
+                try:
+                    mtime = de.stat().st_mtime
+                    saved_entry = saved.pop(video_id, None)
+                    if saved_entry is not None and saved_entry[0] == mtime:
+                        entries.append(saved_entry)
+                        continue
+                    # Only the id, URL and title are needed for the index, so read the raw
+                    # yt-dlp dict rather than building a full YtdlpInfo for every file.
+                    raw = _load_json(Path(de.path))
+                    yt_source: YouTubeSource = YouTubeSource.from_ytdlpinfo(info=raw)
+                    if yt_source.id != video_id:
+                        yt_source = replace(yt_source, id=video_id)
+                    entries.append((mtime, yt_source))
+                    changed = True
+                except (OSError, ValueError) as e:
+                    logger.warning("Skipping unreadable cache file %s: %s", de.path, e)
+                    continue
+
+        self._index.replace_all(entries)
+        # Anything left in saved is for an info file that no longer exists.
+        if changed or saved:
+            self._save_index_file()
+
+    def _load_index_file(self) -> dict[str, tuple[float, YouTubeSource]]:
+        """ Read the index sidecar.
+            Returns:
+                The saved (mtime, YouTubeSource) index entries keyed by video ID, or an empty
+                dictionary if the sidecar is missing or unreadable.
+        """
+        saved: dict[str, tuple[float, YouTubeSource]] = {}
+        try:
+            lines = (self.cache_dir / INDEX_FILE_NAME).read_bytes().splitlines()
+            for line in lines:
+                if not line:
+                    continue
+                d = json.loads(line)
+                yt_source = YouTubeSource(
+                    kind=YoutubeIdKind.VIDEO,
+                    **{name: d[name] for name in _INDEX_FIELDS},
+                )
+                saved[yt_source.id] = (d["mtime"], yt_source)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable cache index %s: %s", INDEX_FILE_NAME, e)
+            return {}
+        return saved
+
+    def _save_index_file(self) -> None:
+        """ Write the in-memory index to the index sidecar."""
+        lines = [
+            _dumps({"mtime": mt, **{name: getattr(yt_src, name) for name in _INDEX_FIELDS}})
+            for mt, yt_src in self.yt_source_list
+        ]
+        lines.append(b"")
+        try:
+            _atomic_write_bytes(self.cache_dir / INDEX_FILE_NAME, b"\n".join(lines))
+            self._index_file_dirty = False
+        except OSError as e:
+            logger.warning("Failed to write cache index %s: %s", INDEX_FILE_NAME, e)
+
+    def save_index(self) -> None:
+        """ Write the index sidecar if cache hits have changed it since it was last written.
+            Call before exiting, so the next startup doesn't re-read the info files viewed
+            in this session.
+        """
+        if self._index_file_dirty:
+            self._save_index_file()
 
     def get_latest_file(self) -> Path | None:
         """ Return the newest .info file, or None if the cache is empty.
@@ -157,7 +467,7 @@ class InfoManager:
             Returns:
                 The Path to the expected .info file for the given video ID.
         """
-        return self.cache_dir / f"{video_id}.json"
+        return self.cache_dir / f"{video_id}{INFO_SUFFIX}"
 
     def remove_stale_files_for_video_id(self, video_id: str, *, keep: Path | None = None) -> None:
         """ Remove stale cache artifacts for the same base video_id.
@@ -167,44 +477,45 @@ class InfoManager:
                 video_id: The YouTube video ID to remove stale files for.
                 keep: An optional Path to a file to keep (e.g. the new .info file being written).
                       If provided, this file will not be deleted even if it matches the prefix.
+                      It must be in cache_dir, since it is matched by name.
         """
         prefix = f"{video_id}."
-        for p in self.cache_dir.iterdir():
-            if not p.is_file():
-                continue
-            if not p.name.startswith(prefix):
-                continue
-            if keep is not None and p.resolve() == keep.resolve():
-                continue
-            try:
-                p.unlink(missing_ok=True)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.warning("Failed to delete stale cache file %s: %s", p, e)
+        keep_name = keep.name if keep is not None else None
+        with os.scandir(self.cache_dir) as dir_iter:
+            for de in dir_iter:
+                # is_file() uses the type from the directory read; it costs no extra syscall.
+                if (
+                    de.name.startswith(prefix)
+                    and de.name != keep_name
+                    and de.is_file(follow_symlinks=False)
+                ):
+                    _unlink_cache_file(de)
 
         # Remove from index too
-        self.yt_source_list = [(mt, yt_src) for (mt,yt_src) in
-                               self.yt_source_list if yt_src.id != video_id]
+        self._info_lru.pop(video_id, None)
+        self._index.pop(video_id)
 
 
     def _prepend_to_index(self, yt_source: YouTubeSource) -> None:
-        """ Prepend info_file to the top of the index and keep it sorted newest->oldest.
+        """ Add or replace the index entry for yt_source, with its info file's mtime.
             Args:
                 yt_source: The YouTubeSource object to add to the index.
         """
         try:
             info_file = self.info_path_for(yt_source.id)
             mtime = info_file.stat().st_mtime
-        except OSError:
-            self.refresh_index()
+        except OSError as e:
+            # Usually a transient problem with this one file; drop it rather than rescanning
+            # the whole cache now.
+            logger.warning("Could not stat %s, rescanning the cache later: %s", yt_source.id, e)
+            self._index.pop(yt_source.id)
+            self._needs_reindex = True
+            # Bump the version even if the ID wasn't indexed yet, so anything that skips work
+            # while the version is unchanged asks for the index again and gets the rescan.
+            self._index.changed()
             return
 
-        # Drop any existing entry for this video ID, then prepend.
-        self.yt_source_list = [(mt, yt_src) for (mt, yt_src) in
-                               self.yt_source_list if yt_src.id != yt_source.id]
-        self.yt_source_list.insert(0, (mtime, yt_source))
-
-        # Optional: keep strict ordering if mtimes collide or clocks are weird
-        self.yt_source_list.sort(key=lambda t: t[0], reverse=True)
+        self._index.put(yt_source.id, (mtime, yt_source))
 
     # ----------------------------
     # Write/update cache entries
@@ -227,16 +538,33 @@ class InfoManager:
         # weird but we can just update the metadata and keep the same .info file.
 
         # If your VideoMetadata.video_id should drive the filename, you can enforce it here:
-        info_file = self.info_path_for(info.id)
-
-       # Remove stale artifacts (including old .url caches) before writing.
-        self.remove_stale_files_for_video_id(info.id, keep=info_file)
-        # write_YtdlpInfo(info_file, info)
-        write_info(info_file, info.raw)
-        logger.info("Cached Ytdlp_info to %s.", info_file)
-
-        yt_source = YouTubeSource.from_ytdlpinfo(info=asdict(info))
+        # info.id is almost always already a canonical id, which a short regex confirms
+        # without running the full URL extraction.
+        video_id = info.id
+        if not (isinstance(video_id, str) and _VIDEO_ID_RE.fullmatch(video_id)):
+            video_id = extract_video_id(info.webpage_url or "")
+            if not video_id:
+                raise ValueError(f"Cannot determine a Video Id for {info.webpage_url}")
+        info_file = self.info_path_for(video_id)
+
+        if _matches_file(info_file, info.raw):
+            # Nothing to write, and no stale artifacts since the file is already current;
+            # just bump the mtime so the entry moves to the top of the history.
+            info_file.touch()
+            logger.info("Ytdlp_info in %s is unchanged.", info_file)
+        else:
+            # Remove stale artifacts (including old .url caches) before writing.
+            self.remove_stale_files_for_video_id(video_id, keep=info_file)
+            # write_YtdlpInfo(info_file, info)
+            write_info(info_file, info.raw)
+            logger.info("Cached Ytdlp_info to %s.", info_file)
+
+        yt_source = YouTubeSource.from_info(info=info)
+        if yt_source.id != video_id:
+            yt_source = replace(yt_source, id=video_id)
         self._prepend_to_index(yt_source)
+        self._remember_info(video_id, info)
+        self._save_index_file()
         # return info_file
 
     # ----------------------------
@@ -252,27 +580,89 @@ class InfoManager:
         if num_entries < 0:
             raise ValueError("num_entries must be >= 0")
 
-        # Ensure we’re operating on a correctly sorted view
-        self.yt_source_list.sort(key=lambda t: t[0], reverse=True)
-
-        stale = self.yt_source_list[num_entries:]
-        keep = self.yt_source_list[:num_entries]
-
-        for _, yt_src in stale:
-            vid = yt_src.id
-            try:
-                # Delete everything for that video_id (including .info itself)
-                self.remove_stale_files_for_video_id(vid, keep=None)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.warning("Error deleting cache artifacts for %s: %s", vid, e)
+        stale_ids: set[str] = {yt_src.id for _, yt_src in self.yt_source_list[num_entries:]}
+        if not stale_ids:
+            return
 
-        self.yt_source_list = keep
+        # Delete everything for the stale video_ids (including .info itself) in one pass
+        # over the directory, rather than one pass per video_id.
+        try:
+            with os.scandir(self.cache_dir) as dir_iter:
+                for de in dir_iter:
+                    if (
+                        de.name.partition(".")[0] in stale_ids
+                        and de.is_file(follow_symlinks=False)
+                    ):
+                        _unlink_cache_file(de)
+        except OSError as e:
+            logger.warning("Error deleting cache artifacts in %s: %s", self.cache_dir, e)
+
+        for vid in stale_ids:
+            self._index.pop(vid)
+            self._info_lru.pop(vid, None)
+        self._save_index_file()
 
     # ----------------------------
     # cached URL list retrieval
     # ----------------------------
 
 
+    def get_cached_ytdlpinfo(self, url: str) -> YtdlpInfo | None:
+        """ Get YtdlpInfo for a URL from the cache only, moving it to the top of the list.
+            Args:
+                url: The YouTube video URL to get the YtdlpInfo for.
+            Returns:
+                The cached YtdlpInfo, or None if the URL isn't cached or its info file
+                can't be read.
+        """
+        self._reindex_if_needed()
+        vid = extract_video_id(url)
+        if not vid:
+            raise ValueError(f"URL does not contain a Video Id. URL:  {url}")
+        entry = self._index.get(vid)
+        if entry is None:
+            return None
+        info_file = self.info_path_for(vid)
+        if not info_file.is_file():
+            return None
+        try:
+            info_file.touch()  # update mtime to reflect recent access
+            # Move just this entry to the top; no need to rescan the directory.
+            self._index.put(vid, (info_file.stat().st_mtime, entry[1]))
+            self._index_file_dirty = True
+            info = self._info_lru.get(vid)
+            if info is None:
+                info = read_ytdlp_info(info_file)
+            self._remember_info(vid, info)
+            return info
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Error reading metadata from %s: %s", info_file, e)
+            return None
+
+    def fetch_ytdlpinfo_async(self, url: str) -> Future[YtdlpInfo]:
+        """ Start fetching YtdlpInfo for a URL from yt-dlp on a worker thread.
+            The result is not cached; pass it to cache_ytdlpinfo() once the future is done,
+            from the thread that owns the cache.
+            Args:
+                url: The YouTube video URL to fetch the YtdlpInfo for.
+            Returns:
+                A Future that resolves to the fetched YtdlpInfo, or raises the fetch error.
+        """
+        future: Future[YtdlpInfo] = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fetch_ytdlp_info(url))
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                future.set_exception(e)
+
+        # A daemon thread rather than an executor worker: executor threads are joined when
+        # Python exits, so closing the window mid-fetch would wait for yt-dlp to finish.
+        threading.Thread(target=run, name="info_cache_fetch", daemon=True).start()
+        return future
+
     def get_ytdlpinfo(self, url: str) -> YtdlpInfo:
         """ Get YtdlpInfo for a URL, checking the cache for the url 
             and if found update the cache list.  If it is not in the cache 
@@ -283,21 +673,10 @@ class InfoManager:
                 A YtdlpInfo object containing the metadata for the given URL, either from cache
                 or freshly fetched.
         """
-        vid = extract_video_id(url)
-        if not vid:
-            raise ValueError(f"URL does not contain a Video Id. URL:  {url}")
         try:
-            for _, yt_src in self.yt_source_list:
-                if yt_src.id == vid:
-                    info_file = self.info_path_for(yt_src.id)
-                    if info_file.is_file():
-                        try:
-                            info_file.touch()  # update mtime to reflect recent access
-                            self.refresh_index()  # re-sort index after mtime update
-                            return read_ytdlp_info(info_file)
-                        except Exception as e:  # pylint: disable=broad-exception-caught
-                            logger.warning("Error reading metadata from %s: %s", info_file, e)
-                            break  # fallback to fetching fresh metadata
+            info = self.get_cached_ytdlpinfo(url)
+            if info is not None:
+                return info
             # If we didn’t find a valid cache entry, fetch fresh metadata.
             new_info: YtdlpInfo = fetch_ytdlp_info(url)
             self.cache_ytdlpinfo(new_info)
@@ -312,30 +691,18 @@ class InfoManager:
         """ Return a list of URLs from the current cache entries, newest first.
             Returns:
                 A list of URLs from the current cache entries, ordered from newest to oldest.
+                The list is shared between calls until the index changes, so callers must
+                not modify it.
         """
-        urls = []
-        for _, yt_source in self.yt_source_list:
-            try:
-                urls.append(yt_source.url)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.warning("Error reading URL from %s: %s", yt_source, e)
-                continue
-        return urls
+        self._reindex_if_needed()
+        return self._index.derived("urls", _urls_of)
 
     def get_cached_prompts(self) -> list[dict[str,str]]:
         """ Return a list of title and URL tuples from the current cache entries, newest first.
             Returns:
                 A list of dictionaries containing the title and URL for each cached entry,
-                ordered from newest to oldest.
+                ordered from newest to oldest. The list is shared between calls until the
+                index changes, so callers must not modify it.
         """
-        choices: list[dict[str,str]] = []
-
-        for _, yt_source in self.yt_source_list:
-            try:
-                # List entries as Video ID: Title
-                key = yt_source.id + ": " + yt_source.title
-                choices.append({'title':key, 'url':yt_source.url})
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.warning("Error reading URL or Title from %s: %s", yt_source, e)
-                continue
-        return choices
+        self._reindex_if_needed()
+        return self._index.derived("prompts", _prompts_of)
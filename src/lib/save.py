@@ -9,6 +9,23 @@ from lib.ui_vars import UiVars
 
 logger = get_logger(__name__)
 
+# Slice size used to stream the transcript to disk, and the file buffer size for writing it.
+_WRITE_CHUNK = 1 << 16
+_WRITE_BUFFER = 1 << 20
+
+
+def _rstrip_len(text: str) -> int:
+    """ Find the length of a string without its trailing whitespace.
+        Args:
+            text: The string to check.
+        Returns:
+            The length text.rstrip() would have, without building that copy of the string.
+    """
+    for i in range(len(text) - 1, -1, -1):
+        if not text[i].isspace():
+            return i + 1
+    return 0
+
 
 
 
@@ -65,6 +82,29 @@ class FileSaver:
         return front_matter
 
 
+    def write_body(self, filepath:Path, front_matter:list[str]) -> None:
+        """ Write the front matter, description and transcript to a file.
+            Args:
+                filepath: The path to write the file to.
+                front_matter: The front matter lines to start the file with.
+            Note:
+                The transcript is written in 64 KiB slices through a 1 MiB buffer, so saving
+                a very long transcript never holds a second full-size copy of it, or of its
+                UTF-8 encoding, in memory.
+        """
+        desc = self.ui.desc_txt.strip()
+        text = self.ui.transcript_txt
+        text_len = _rstrip_len(text)
+        with filepath.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+            f.write("\n".join(front_matter))
+            f.write("## Description\n\n")
+            f.write(desc)
+            f.write("\n\n" if desc else "\n")
+            f.write("## Transcript / Output\n\n")
+            for i in range(0, text_len, _WRITE_CHUNK):
+                f.write(text[i:min(i + _WRITE_CHUNK, text_len)])
+            f.write("\n")
+
     def save_md(self, filepath:Path) -> None:
         """ Save the transcript and info as a markdown file.
             Args:
@@ -72,17 +112,7 @@ class FileSaver:
         """
 
         front_matter = self.create_front_matter()
-
-        body = (
-            "\n".join(front_matter)
-            + "## Description\n\n"
-            + (self.ui.desc_txt.strip() + "\n\n" if
-               self.ui.desc_txt.strip() else "\n")
-            + "## Transcript / Output\n\n"
-            + self.ui.transcript_txt.rstrip()
-            + "\n"
-        )
-        filepath.write_text(body, encoding="utf-8")
+        self.write_body(filepath, front_matter)
 
     def save_txt(self, filepath:Path) -> None:
         """ Save the transcript and info as a text file.
@@ -93,14 +123,4 @@ class FileSaver:
         front_matter = self.create_front_matter()
         # remove the first and last lines of the front matter, the '---' lines.
         front_matter = front_matter[1:-1]
-
-        body = (
-            "\n".join(front_matter)
-            + "## Description\n\n"
-            + (self.ui.desc_txt.strip() + "\n\n" if
-               self.ui.desc_txt.strip() else "\n")
-            + "## Transcript / Output\n\n"
-            + self.ui.transcript_txt.rstrip()
-            + "\n"
-        )
-        filepath.write_text(body, encoding="utf-8")
+        self.write_body(filepath, front_matter)
@@ -4,7 +4,12 @@
 
 from __future__ import annotations
 
-from urllib.parse import urlparse
+import re
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from functools import lru_cache
+from urllib.parse import urlsplit
 import tkinter as tk
 from tkinter import StringVar, Text
 from yt_lib.yt_ids import extract_video_id
@@ -13,7 +18,11 @@ from yt_lib.ytdlp_info import YtdlpInfo
 from yt_lib.utils.log_utils import get_logger
 from yt_lib.utils.app_context import RuntimeContext
 from lib.info_cache import InfoManager
-from lib.format_transcript import json_to_sentences, json_to_text, convert_json
+from lib.format_transcript import (
+        json_to_sentences,
+        json_to_text,
+        convert_json,
+    )
 from lib.display_field import DisplayField, DurationField, FileSizeField
 from lib.print.layout_types import (
         RenderItem,
@@ -25,6 +34,58 @@ from lib.print.layout_types import (
 
 logger = get_logger(__name__)
 
+# Hosts that can serve a YouTube video URL, including subdomains like www. and m.
+_YT_HOST_RE: re.Pattern[str] = re.compile(
+    r"(?:^|\.)(?:youtube\.com|youtu\.be|youtube-nocookie\.com)$", re.IGNORECASE
+)
+
+# The two common shapes of a YouTube video URL, watch?v=<id> and youtu.be/<id>. URLs that
+# match are accepted without parsing them or running the full video ID extraction.
+_YT_URL_RE: re.Pattern[str] = re.compile(
+    r"https?://(?:www\.|m\.)?"
+    r"(?:youtube\.com/watch\?(?:[^#\s]*&)?v=|youtu\.be/)"
+    r"[\w-]{11}(?![\w-])",
+    re.ASCII,
+)
+
+# Number of formatted transcripts kept by UiVars, see UiVars.update_transcript.
+RENDERED_CACHE_SIZE = 8
+
+# How often, in milliseconds, UiVars checks whether a yt-dlp fetch has finished.
+FETCH_POLL_MS = 100
+
+# Transcript formatter for each (lower-cased) "Transcript type" radio button value.
+_TRANSCRIPT_FORMATTERS: dict[str, Callable[..., str]] = {
+    "json": convert_json,
+    "text": json_to_text,
+    "sentences": json_to_sentences,
+}
+
+@lru_cache(maxsize=256)
+def _parsed(text: str) -> tuple[bool, bool]:
+    """ Parse a URL once and remember the result, since the same URL is checked on every
+        focus change, Enter, and transcript type change.
+        Args:
+            text: The stripped URL to check.
+        Returns:
+            A tuple of (url_ok, yt_ok), where url_ok is True if the URL has a scheme and
+            a host, and yt_ok is True if a YouTube video ID can be extracted from it.
+    """
+    if _YT_URL_RE.match(text):
+        return True, True
+    # urlsplit skips urlparse's extra pass for ';params', which YouTube URLs never use.
+    parsed = urlsplit(text)
+    url_ok = bool(parsed.scheme and parsed.netloc)
+    # Most URLs that aren't YouTube's are rejected on the host name alone, without running
+    # the full video ID extraction.
+    yt_ok = (
+        url_ok
+        and _YT_HOST_RE.search(parsed.hostname or "") is not None
+        and extract_video_id(text) is not None
+    )
+    return url_ok, yt_ok
+
+
 def is_valid_youtube_url(text: str) -> bool:
     """ Basic check for whether a URL is a valid YouTube video URL.
         Args:
@@ -36,11 +97,8 @@ def is_valid_youtube_url(text: str) -> bool:
     if not text:
         return False
 
-    parsed = urlparse(text)
-    if not parsed.scheme or not parsed.netloc:
-        return False
-
-    return extract_video_id(text) is not None
+    url_ok, yt_ok = _parsed(text)
+    return url_ok and yt_ok
 
 
 # @dataclass(slots=True)
@@ -82,6 +140,11 @@ class UiVars:
     desc_widget: Text | None
     transcript_widget: Text | None
     previous_url: str
+    last_rendered: tuple[str, str] | None
+    rendered_cache: OrderedDict[tuple[str, str], str]
+    shown_text: dict[str, str]
+    pending_url: str | None
+    on_info_cached: Callable[[], None] | None
 
 
     def __init__(
@@ -192,6 +255,13 @@ class UiVars:
         self.desc_widget = None
         self.transcript_widget = None
         self.previous_url = ""
+        self.last_rendered = None
+        self.rendered_cache = OrderedDict()
+        self.shown_text = {}
+        # URL whose metadata is being fetched on a worker thread, see start_fetch.
+        self.pending_url = None
+        # Called after freshly fetched metadata has been added to the cache.
+        self.on_info_cached = None
 
     def set_desc_widget(self, widget: Text) -> None:
         """ Store a reference to the description Text widget, so we can 
@@ -218,11 +288,19 @@ class UiVars:
         """ Set default values for the widgets. """
         self.combo_url.set("")
         self.transcript_rb.set("Json")
+        self.transcript_type.set(self.transcript_rb.get())
+        # self.out_format.set("markdown")
+        self.clear_video()
+        self.transcript_json = ""
+        self.previous_url = ""
+
+    def clear_video(self) -> None:
+        """ Set default values for the fields, description and transcript of the current
+            video, so nothing of a previous video is shown, saved or printed.
+        """
         self.video_id.set("")
         self.title.set("")
         self.url.set("")
-        self.transcript_type.set(self.transcript_rb.get())
-        # self.out_format.set("markdown")
         self.ext.set("")
         self.resolution.set("")
         self.video_format.set("")
@@ -230,14 +308,13 @@ class UiVars:
         self.duration.set("00")
         self.file_size.set(0)
         self.bit_rate.set(0.0)
-        self.transcript_json = ""
         self.desc_txt = """- Description -"""
         if self.desc_widget is not None:
             self.set_text(self.desc_widget, self.desc_txt)
         self.transcript_txt = """- Transcript -"""
         if self.transcript_widget is not None:
             self.set_text(self.transcript_widget, self.transcript_txt)
-        self.previous_url = ""
+        self.last_rendered = None
 
     # -----------------------------------------------------------------------------
     # Controller/update function
@@ -249,18 +326,47 @@ class UiVars:
             Convert/cache metadata -> widget variables.
             Keep ALL mapping/formatting rules here.
 
-            Called whenever the URL changes, or the transcript type changes, to update all
-            metadata fields and the transcript.
+            Called whenever the URL changes to update all metadata fields and the transcript.
+            Transcript type changes go through format_change().
         """
         combo_url = self.combo_url.get().strip()
         if not combo_url:
             return
         if not is_valid_youtube_url(combo_url):
             return
-        info: YtdlpInfo = self.cache.get_ytdlpinfo(combo_url)
+        # Focus changes and repeated Enters re-trigger this with nothing changed; skip
+        # re-reading the cache and re-formatting the transcript for those.
+        render_key = (combo_url, str(self.transcript_rb.get()))
+        if render_key == self.last_rendered and self.transcript_txt:
+            return
+        cached = self.cache.get_cached_ytdlpinfo(combo_url)
+        if cached is None:
+            # Fetching from yt-dlp takes seconds; do it off the Tk main loop. poll_fetch
+            # shows the result when it arrives.
+            self.start_fetch(combo_url)
+            return
+        self.update_metadata(cached)
+        self.update_transcript(combo_url)
+        self.last_rendered = render_key
+
+    def format_change(self) -> None:
+        """ Update the UI after the transcript type changed. The metadata shown doesn't
+            depend on the transcript type, so if it is already showing the current URL only
+            the transcript is updated.
+        """
+        combo_url = self.combo_url.get().strip()
+        if self.last_rendered is None or self.last_rendered[0] != combo_url:
+            self.ui_change()
+            return
+        self.update_transcript(combo_url)
+        self.last_rendered = (combo_url, str(self.transcript_rb.get()))
 
+    def update_metadata(self, info: YtdlpInfo) -> None:
+        """ Set the metadata fields and description from a video's YtdlpInfo.
+            Args:
+                info: The YtdlpInfo of the video to show.
+        """
         # Required
-        self.transcript_type.set(self.transcript_rb.get())
         self.video_id.set(str(info.id).strip())
         self.title.set(str(info.title).strip())
         self.url.set(str(info.webpage_url).strip())
@@ -281,23 +387,98 @@ class UiVars:
         self.desc_txt = info.description.strip() if info.description else ""
         if self.desc_widget is not None:
             self.set_text(self.desc_widget, self.desc_txt)
-        if combo_url != self.previous_url:
-            self.previous_url = combo_url
-            self.transcript_json = yt_json(combo_url)
-        # ---- transcript output ----
-        match str(self.transcript_rb.get()).lower().strip():
-            case "json":
-                self.transcript_txt = convert_json(self.transcript_json)
-            case "text":
-                self.transcript_txt = json_to_text(self.transcript_json)
-            case "sentences":
-                self.transcript_txt = json_to_sentences(self.transcript_json)
-            case _:
-                self.transcript_txt = f"Unknown format: {self.transcript_type.get()}"
 
+    def update_transcript(self, combo_url: str) -> None:
+        """ Show the transcript of the current video in the selected transcript type.
+            update_metadata() must have been called for the video first.
+            Args:
+                combo_url: The URL of the video, used to download its transcript.
+        """
+        self.transcript_type.set(self.transcript_rb.get())
+        # Formatting a long transcript (as sentences especially) is slow, so the
+        # last few results are kept, keyed by video and format, for flipping back and forth
+        # between transcript types or videos.
+        transcript_fmt = str(self.transcript_rb.get()).lower().strip()
+        cache_key = (self.video_id.get(), transcript_fmt)
+        transcript_txt = self.rendered_cache.get(cache_key)
+        if transcript_txt is not None:
+            self.rendered_cache.move_to_end(cache_key)
+        else:
+            if combo_url != self.previous_url:
+                self.transcript_json = yt_json(combo_url)
+                # Only once the download worked, so a failed one is retried rather than
+                # formatting (and caching) the previous video's transcript.
+                self.previous_url = combo_url
+            formatter = _TRANSCRIPT_FORMATTERS.get(transcript_fmt)
+            if formatter is not None:
+                transcript_txt = formatter(self.transcript_json)
+            else:
+                transcript_txt = f"Unknown format: {self.transcript_type.get()}"
+            self.rendered_cache[cache_key] = transcript_txt
+            if len(self.rendered_cache) > RENDERED_CACHE_SIZE:
+                self.rendered_cache.popitem(last=False)
+
+        self.transcript_txt = transcript_txt
         if self.transcript_widget is not None:
             self.set_text(self.transcript_widget, self.transcript_txt)
 
+    def start_fetch(self, url: str) -> None:
+        """ Fetch metadata for a URL that isn't cached yet on a worker thread, showing a
+            loading message in the transcript until it is done. The previous video's data
+            is cleared meanwhile, so saving or printing can't export it.
+            Args:
+                url: The YouTube video URL to fetch.
+        """
+        if url == self.pending_url:
+            return
+        self.pending_url = url
+        self.clear_video()
+        if self.transcript_widget is not None:
+            self.set_text(self.transcript_widget, "Loading…")
+        future = self.cache.fetch_ytdlpinfo_async(url)
+        self.win.after(FETCH_POLL_MS, self.poll_fetch, url, future)
+
+    def poll_fetch(self, url: str, future: Future[YtdlpInfo]) -> None:
+        """ Check on a fetch started by start_fetch. Once it is done, cache the result on
+            the main thread and show it if the URL is still the one selected. The fetched
+            info is shown as is rather than looked up in the cache again, so a failure to
+            cache it can't start another fetch.
+            Args:
+                url: The YouTube video URL being fetched.
+                future: The Future returned by InfoManager.fetch_ytdlpinfo_async.
+        """
+        if not future.done():
+            self.win.after(FETCH_POLL_MS, self.poll_fetch, url, future)
+            return
+        if self.pending_url == url:
+            self.pending_url = None
+        current = url == self.combo_url.get().strip()
+        # The URL was changed to something that neither showed a video nor started a fetch
+        # of its own (e.g. an invalid URL), so nothing else will replace "Loading…".
+        idle = not current and self.pending_url is None and self.last_rendered is None
+        try:
+            info: YtdlpInfo = future.result()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Error fetching YtdlpInfo for %s: %s", url, e)
+            if current and self.transcript_widget is not None:
+                self.set_text(self.transcript_widget, f"Error loading {url}: {e}")
+            elif idle:
+                self.clear_video()
+            return
+        try:
+            self.cache.cache_ytdlpinfo(info)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Error caching YtdlpInfo for %s: %s", url, e)
+        else:
+            if self.on_info_cached is not None:
+                self.on_info_cached()
+        if current:
+            self.update_metadata(info)
+            self.update_transcript(url)
+            self.last_rendered = (url, str(self.transcript_rb.get()))
+        elif idle:
+            self.clear_video()
+
     # -----------------------------------------------------------------------------
     # Small UI helpers
     # -----------------------------------------------------------------------------
@@ -308,6 +489,12 @@ class UiVars:
                 widget: The Text widget to update. Must be disabled, since it's only for display.
                 value: The text to insert into the widget.
         """
+        # Replacing a Text widget's content makes Tk re-layout all of it, which is slow for a
+        # long transcript, so skip it when the widget already shows this text.
+        key = str(widget)
+        if self.shown_text.get(key) == value:
+            return
+        self.shown_text[key] = value
         widget.configure(state="normal")
         widget.delete("1.0", "end")
         widget.insert("1.0", value)
@@ -24,6 +24,8 @@ from lib.menus import MenuCommands
 APP_NAME = "yt_app"
 APP_AUTHOR = "HenCode"
 
+logger = get_logger(__name__)
+
 ###############################################################################
 #
 # Context configuration to pass APP data/objects around without globals or tight
@@ -32,26 +34,38 @@ APP_AUTHOR = "HenCode"
 ################################################################################
 
 
-ctx = create_user_context(app_name = APP_NAME, app_author = APP_AUTHOR,
-                          app_dir = Path(__file__).parent)
-ctx_store = RuntimeContext(ctx=ctx)
+def create_runtime_context() -> RuntimeContext:
+    """ Create the context that holds the app's OS-appropriate user directories.
+        Returns:
+            The RuntimeContext for the app.
+    """
+    ctx = create_user_context(app_name = APP_NAME, app_author = APP_AUTHOR,
+                              app_dir = Path(__file__).parent)
+    return RuntimeContext(ctx=ctx)
 
 ###############################################################################
 #
 # Logging setup: configure a logger for the app, with file output to an
 # OS-appropriate user log directory.
+# Done from main() rather than at import, so importing this module doesn't attach
+# handlers or open the log file.
 #
 ################################################################################
 
-log_cfg = LogConfig(log_root=APP_NAME)
-file_log_conf = FileLogConfig(log_file = ctx_store.log_dir / "yt_app.log")
 
-configure_logging(cfg=log_cfg,
-                  file_log_conf=file_log_conf,
-                  force=True,
-                  tee_console=False
-                )
-logger = get_logger(__name__)
+def setup_logging(ctx_store: RuntimeContext) -> None:
+    """ Configure the app's logging to write to the user log directory.
+        Args:
+            ctx_store: The RuntimeContext holding the log directory.
+    """
+    log_cfg = LogConfig(log_root=APP_NAME)
+    file_log_conf = FileLogConfig(log_file = ctx_store.log_dir / "yt_app.log")
+
+    configure_logging(cfg=log_cfg,
+                      file_log_conf=file_log_conf,
+                      force=True,
+                      tee_console=False
+                    )
 
 # -----------------------------------------------------------------------------
 # Main
@@ -59,6 +73,9 @@ logger = get_logger(__name__)
 def main() -> None:
     """Set up the GUI, load initial data, and bind events."""
 
+    ctx_store = create_runtime_context()
+    setup_logging(ctx_store)
+
     cache = InfoManager(ctx_store)
     root = tk.Tk()
     root.title("yt_app")
@@ -101,8 +118,19 @@ def main() -> None:
 
     # Populate the URL dropdown with cached URLs. This is done here at setup, and also
     # after any URL selection or change, to ensure it stays up to date with the cache.
-    choices = cache.get_cached_urls()
-    cmbo_url["values"] = choices
+    # The dropdown is only refilled when the cache index has changed since it was last
+    # filled, as setting the values rebuilds the whole Tk list.
+    shown_version = -1
+
+    def refresh_choices() -> None:
+        """ Refill the URL dropdown if the cache index changed since it was last filled. """
+        nonlocal shown_version
+        if cache.index_version == shown_version:
+            return
+        cmbo_url["values"] = cache.get_cached_urls()
+        shown_version = cache.index_version
+
+    refresh_choices()
 
     # --- Info frame ---
     # Holds information about the currently selected video/transcript, and updates
@@ -216,11 +244,13 @@ def main() -> None:
     ui_vars.set_transcript_widget(txt_out)
 
     ui_vars.clear()
+    # Metadata fetched in the background lands in the cache after do_populate has run.
+    ui_vars.on_info_cached = refresh_choices
 
     def do_populate() -> None:
         """ Small helper to repopulate the UI upon a change in the URL or transcript type. """
         ui_vars.ui_change()
-        cmbo_url["values"] = cache.get_cached_urls()
+        refresh_choices()
 
     cmbo_url.bind("<<ComboboxSelected>>", lambda _e: do_populate())
     cmbo_url.bind("<Return>", lambda _e: do_populate())
@@ -233,7 +263,8 @@ def main() -> None:
                 *_args: Required by the trace_add callback signature, but not used.
         """
         if is_valid_youtube_url(cmbo_url.get()):
-            do_populate()
+            ui_vars.format_change()
+            refresh_choices()
         else:
             # If the URL is not valid, just update the transcript type variable so it shows in the
             # info section.
@@ -242,6 +273,8 @@ def main() -> None:
     ui_vars.transcript_rb.trace_add("write", on_format_change)
 
     root.mainloop()
+    # Cache hits only update the index sidecar in memory; write it out once at exit.
+    cache.save_index()
 
 if __name__ == "__main__":
     main()